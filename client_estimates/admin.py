@@ -1,6 +1,9 @@
 from decimal import Decimal, InvalidOperation
+import copy
 import csv
+import io
 import json
+import re
 
 from django import forms
 from django.contrib import admin, messages
@@ -9,7 +12,8 @@ from django.contrib.admin.options import IS_POPUP_VAR, TO_FIELD_VAR
 from django.contrib.admin.utils import flatten_fieldsets, unquote
 from django.core.exceptions import PermissionDenied
 from django.contrib.admin.exceptions import DisallowedModelAdminToField
-from django.db.models import Count, F
+from django.db import transaction
+from django.db.models import Count, F, Prefetch, prefetch_related_objects
 from django.forms.formsets import all_valid
 from django.http import HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
@@ -39,6 +43,8 @@ from .models import (
     EstimatePlannerEntry,
     PlannerOptionCard,
     PlannerOptionIcon,
+    DERIVED_TOTALS_FIELDS,
+    FOOD_CHOICE_MENU_ORDER,
     PLANNER_ICON_KEY_CHOICES,
     PLANNER_SECTION_CHOICES,
     ShoppingList,
@@ -47,6 +53,11 @@ from .models import (
 )
 from .kiddush_menu import ensure_kiddush_menu, ensure_kiddush_planning_fee_line
 
+TWO_PLACES = Decimal("0.01")
+ZERO_MONEY = Decimal("0.00")
+UNIT_RATE = Decimal("1.00")
+DEFAULT_DEPOSIT_PERCENT = Decimal("30.00")
+
 # ==========================
 # 🔐 PERMISSIONS & SCOPING
 # ==========================
@@ -56,7 +67,10 @@ def limit_to_user_caterer(queryset, request):
         return queryset.none()
     if user.is_superuser:
         return queryset
-    return queryset.filter(caterer__owner=user)
+    if getattr(request, "_user_has_caterer", None) is False:
+        # user_has_caterer_account() already found no account this request.
+        return queryset.none()
+    return queryset.select_related("caterer__owner").filter(caterer__owner=user)
 
 def user_can_access_caterer(request, obj=None):
     user = getattr(request, "user", None)
@@ -69,13 +83,93 @@ def user_can_access_caterer(request, obj=None):
     return obj.owner == user
 
 
+def _is_changelist(request):
+    match = getattr(request, "resolver_match", None)
+    return match is not None and (match.url_name or "").endswith("_changelist")
+
+
+def _changelist_only(queryset, request, fields):
+    """
+    Narrow the changelist SELECT to the columns it renders. Change and delete
+    views share get_queryset, so they keep full rows.
+    """
+    if _is_changelist(request):
+        return queryset.only(*fields)
+    return queryset
+
+
+def _changelist_defer(queryset, request, fields):
+    """
+    Skip large columns on the changelist only; the change form edits them.
+    """
+    if _is_changelist(request):
+        return queryset.defer(*fields)
+    return queryset
+
+
+def _user_caterer_qs(request):
+    # Memoized per request; callers that narrow it further get a fresh clone.
+    qs = getattr(request, "_user_caterer_qs", None)
+    if qs is None:
+        qs = CatererAccount.objects.filter(owner=request.user)
+        request._user_caterer_qs = qs
+    return qs
+
+
+def _user_estimate_choices_qs(request):
+    # Estimate dropdowns only render __str__, so load just those columns.
+    qs = getattr(request, "_user_estimate_choices_qs", None)
+    if qs is None:
+        qs = Estimate.objects.only("id", "caterer_id", "customer_name", "event_type", "event_date")
+        if not request.user.is_superuser:
+            qs = qs.filter(caterer__owner=request.user)
+        request._user_estimate_choices_qs = qs
+    return qs
+
+
+def _get_request_caterer(request):
+    # The user's first caterer, resolved once per request (None is cached too).
+    if not hasattr(request, "_caterbase_caterer"):
+        request._caterbase_caterer = _user_caterer_qs(request).first()
+    return request._caterbase_caterer
+
+
 def user_has_caterer_account(request):
     user = getattr(request, "user", None)
     if not getattr(user, "is_authenticated", False):
         return False
     if user.is_superuser:
         return True
-    return CatererAccount.objects.filter(owner=user).exists()
+    has_caterer = getattr(request, "_user_has_caterer", None)
+    if has_caterer is None:
+        has_caterer = _user_caterer_qs(request).exists()
+        request._user_has_caterer = has_caterer
+    return has_caterer
+
+
+class CatererScopedAdminMixin:
+    """
+    Limits a caterer-owned model's admin to the user's caterer: rows via
+    limit_to_user_caterer, and the caterer form field to their own account.
+    """
+
+    caterer_field = "caterer"
+    changelist_only_fields = None
+
+    def get_queryset(self, request):
+        qs = limit_to_user_caterer(super().get_queryset(request), request)
+        if self.changelist_only_fields:
+            qs = _changelist_only(qs, request, self.changelist_only_fields)
+        return qs
+
+    def get_form(self, request, obj=None, **kwargs):
+        form = super().get_form(request, obj, **kwargs)
+        if not request.user.is_superuser and self.caterer_field in form.base_fields:
+            form.base_fields[self.caterer_field].queryset = _user_caterer_qs(request)
+        return form
+
+
+_MEAL_SPLIT = re.compile(r"[,\r\n]+")
 
 
 def parse_meal_plan(raw_value):
@@ -84,7 +178,7 @@ def parse_meal_plan(raw_value):
     if isinstance(raw_value, list):
         names = raw_value
     else:
-        names = [line.strip() for line in str(raw_value).replace(",", "\n").splitlines()]
+        names = [line.strip() for line in _MEAL_SPLIT.split(str(raw_value))]
     return [name for name in names if name]
 
 
@@ -299,15 +393,15 @@ class CatererAccountAdmin(admin.ModelAdmin):
         ),
     )
     fieldsets = base_fieldsets
+    owner_fieldsets = tuple(fs for fs in base_fieldsets if fs[0] != "Dashboard Messaging")
 
     def get_fieldsets(self, request, obj=None):
-        fieldsets = list(self.base_fieldsets)
         if request.user.is_superuser:
-            return fieldsets
-        return [fs for fs in fieldsets if fs[0] != "Dashboard Messaging"]
+            return self.base_fieldsets
+        return self.owner_fieldsets
 
     def get_queryset(self, request):
-        qs = super().get_queryset(request)
+        qs = super().get_queryset(request).select_related("owner")
         if request.user.is_superuser:
             return qs
         return qs.filter(owner=request.user)
@@ -325,71 +419,50 @@ class CatererAccountAdmin(admin.ModelAdmin):
 # MENU CATEGORY ADMIN
 # ==========================
 @admin.register(MenuCategory)
-class MenuCategoryAdmin(admin.ModelAdmin):
+class MenuCategoryAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("name", "caterer", "sort_order")
     list_editable = ("sort_order",)
     list_filter = ("caterer",)
     ordering = ["sort_order"]
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    list_select_related = ("caterer",)
 
 
 @admin.register(ClientInquiry)
-class ClientInquiryAdmin(admin.ModelAdmin):
+class ClientInquiryAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("contact_name", "caterer", "status", "event_date", "created_at")
     list_filter = ("status", "caterer")
     search_fields = ("contact_name", "company_name", "email", "phone")
     readonly_fields = ("created_at", "updated_at")
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    list_select_related = ("caterer",)
+    show_full_result_count = False
+    changelist_only_fields = ("contact_name", "caterer", "status", "event_date", "created_at")
 
     def has_add_permission(self, request):
         return user_has_caterer_account(request)
 
 
 @admin.register(ClientProfile)
-class ClientProfileAdmin(admin.ModelAdmin):
+class ClientProfileAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("name", "caterer", "email", "phone", "birthday")
     search_fields = ("name", "email", "phone")
     list_filter = ("caterer",)
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    list_select_related = ("caterer",)
+    show_full_result_count = False
+    changelist_only_fields = ("name", "caterer", "email", "phone", "birthday")
 
 
 @admin.register(CatererTask)
-class CatererTaskAdmin(admin.ModelAdmin):
+class CatererTaskAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("title", "caterer", "due_date", "completed")
     list_filter = ("completed", "caterer")
     search_fields = ("title", "description")
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
+    list_select_related = ("caterer", "related_inquiry")
+    show_full_result_count = False
+    autocomplete_fields = ("related_inquiry",)
 
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
         if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
             if "related_inquiry" in form.base_fields:
                 form.base_fields["related_inquiry"].queryset = ClientInquiry.objects.filter(
                     caterer__owner=request.user
@@ -402,11 +475,95 @@ class CatererTaskAdmin(admin.ModelAdmin):
 # ==========================
 # MENU ITEM ADMIN + CSV UPLOAD
 # ==========================
+_ZERO = Decimal("0")
+_ONE = Decimal("1.0")
+_TRUTHY = frozenset({"true", "1", "yes", "y", "t"})
+_REQUIRED_CSV_COLUMNS = ("item_type", "category", "name")
+_NEW_ITEM_FIELDS = frozenset({"name", "description", "cost", "markup", "servings"})
+# Plain decimal strings; anything else (blank, "abc", NaN, exponents) takes the default
+# without going through Decimal's InvalidOperation path.
+_DECIMAL_RE = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def _parse_decimal(value, default=_ZERO):
+    raw = value.strip() if isinstance(value, str) else ""
+    return Decimal(raw) if _DECIMAL_RE.fullmatch(raw) else default
+
+
+def _parse_int(value):
+    try:
+        raw = value.strip() if value is not None else ""
+        if not raw:
+            return None
+        return int(Decimal(raw))
+    except (InvalidOperation, ValueError, AttributeError):
+        return None
+
+
 class MenuUploadForm(forms.Form):
     csv_file = forms.FileField()
 
+
+def _build_menu_template_csv():
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(
+        [
+            "item_type",
+            "category",
+            "name",
+            "description",
+            "sort_order_override",
+            "cost_per_serving",
+            "markup",
+            "default_servings_per_person",
+            "is_active",
+        ]
+    )
+    writer.writerows(
+        [
+            ["Food", "Starters", "Smoked Salmon Bites", "Mini bagels with lox", "1", "12.50", "3.0", "1.0", "True"],
+            ["Food", "Mains", "Steak Strip", "Grilled steak strips", "", "28.00", "", "1.0", "True"],
+            ["Extra", "Rental", "Projector", "", "", "400", "3.0", "1.0", "True"],
+        ]
+    )
+    return buffer.getvalue().encode("utf-8")
+
+
+# The downloadable sample never changes, so render it once at import.
+_MENU_TEMPLATE_CSV = _build_menu_template_csv()
+
+
+def _read_csv_rows(uploaded_file):
+    """
+    Decode the upload row by row (UTF-8 with BOM, falling back to latin-1)
+    instead of holding the raw bytes and a decoded copy in memory.
+    Returns a {header: position} map and the non-blank data rows as lists.
+    The rows are materialized on purpose: upload_csv validates every row and
+    collects the category names before it writes anything.
+    """
+    for encoding in ("utf-8-sig", "latin-1"):
+        uploaded_file.seek(0)
+        wrapped = io.TextIOWrapper(uploaded_file.file, encoding=encoding, newline="")
+        try:
+            reader = csv.reader(wrapped)
+            header = next(reader, [])
+            columns = {name: position for position, name in enumerate(header)}
+            return columns, [row for row in reader if row]
+        except UnicodeDecodeError:
+            continue
+        finally:
+            wrapped.detach()
+    return {}, []
+
+
+def _csv_cell(row, position, default=None):
+    if position is None or position >= len(row):
+        return default
+    return row[position]
+
 @admin.register(MenuItem)
-class MenuItemAdmin(admin.ModelAdmin):
+class MenuItemAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = (
         "name",
         "sort_order_override",
@@ -418,19 +575,27 @@ class MenuItemAdmin(admin.ModelAdmin):
         "is_active",
     )
     list_editable = ("sort_order_override",)
-    list_filter = ("caterer", "category", "menu_type", "is_active")
+    list_filter = (
+        ("caterer", admin.RelatedOnlyFieldListFilter),
+        ("category", admin.RelatedOnlyFieldListFilter),
+        "menu_type",
+        "is_active",
+    )
     search_fields = ("name",)
     change_list_template = "admin/menu_upload.html"
     ordering = ("category__sort_order", "category__name", "sort_order_override", "name")
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    list_select_related = ("caterer", "category")
+    show_full_result_count = False
+    changelist_only_fields = (
+        "name",
+        "sort_order_override",
+        "caterer",
+        "category",
+        "menu_type",
+        "cost_per_serving",
+        "markup",
+        "is_active",
+    )
 
 
 @admin.register(TastingAppointment)
@@ -448,6 +613,7 @@ class TastingAppointmentAdmin(admin.ModelAdmin):
     search_fields = ("title", "client_name", "client_email", "client_phone", "notes")
     readonly_fields = ("created_at",)
     ordering = ("start_at",)
+    list_select_related = ("caterer", "estimate")
 
     def get_queryset(self, request):
         return limit_to_user_caterer(super().get_queryset(request), request)
@@ -455,8 +621,9 @@ class TastingAppointmentAdmin(admin.ModelAdmin):
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
         if not request.user.is_superuser and "caterer" in form.base_fields:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-            form.base_fields["estimate"].queryset = Estimate.objects.filter(caterer__owner=request.user)
+            form.base_fields["caterer"].queryset = _user_caterer_qs(request)
+        if "estimate" in form.base_fields:
+            form.base_fields["estimate"].queryset = _user_estimate_choices_qs(request)
         return form
 
     def get_changeform_initial_data(self, request):
@@ -464,10 +631,20 @@ class TastingAppointmentAdmin(admin.ModelAdmin):
         estimate_id = request.GET.get("estimate")
         if estimate_id:
             try:
-                estimate = Estimate.objects.select_related("caterer", "caterer__owner").get(pk=estimate_id)
+                estimate = (
+                    Estimate.objects.select_related("caterer")
+                    .only(
+                        "customer_name",
+                        "customer_email",
+                        "customer_phone",
+                        "caterer__name",
+                        "caterer__owner",
+                    )
+                    .get(pk=estimate_id)
+                )
             except Estimate.DoesNotExist:
                 return initial
-            if request.user.is_superuser or estimate.caterer.owner == request.user:
+            if request.user.is_superuser or estimate.caterer.owner_id == request.user.pk:
                 initial.setdefault("caterer", estimate.caterer)
                 initial.setdefault("estimate", estimate)
                 initial.setdefault("client_name", estimate.customer_name)
@@ -768,7 +945,7 @@ class PlannerOptionIconAdmin(admin.ModelAdmin):
         if request.user.is_superuser:
             caterer_ids = list(CatererAccount.objects.values_list("id", flat=True))
         else:
-            caterer_ids = list(CatererAccount.objects.filter(owner=request.user).values_list("id", flat=True))
+            caterer_ids = list(_user_caterer_qs(request).values_list("id", flat=True))
 
         if not caterer_ids:
             self.message_user(request, "No accessible caterers found.", level=messages.WARNING)
@@ -911,9 +1088,9 @@ class ShoppingListAdmin(admin.ModelAdmin):
     def get_form(self, request, obj=None, **kwargs):
         form = super().get_form(request, obj, **kwargs)
         if not request.user.is_superuser and "caterer" in form.base_fields:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        if not request.user.is_superuser and "estimate" in form.base_fields:
-            form.base_fields["estimate"].queryset = Estimate.objects.filter(caterer__owner=request.user)
+            form.base_fields["caterer"].queryset = _user_caterer_qs(request)
+        if "estimate" in form.base_fields:
+            form.base_fields["estimate"].queryset = _user_estimate_choices_qs(request)
         return form
 
 
@@ -990,74 +1167,113 @@ class TrialRequestAdmin(admin.ModelAdmin):
             form = MenuUploadForm(request.POST, request.FILES)
             if form.is_valid():
                 file = form.cleaned_data["csv_file"]
-                raw_bytes = file.read()
-                try:
-                    decoded = raw_bytes.decode("utf-8-sig").splitlines()
-                except UnicodeDecodeError:
-                    decoded = raw_bytes.decode("latin-1").splitlines()
-                reader = csv.DictReader(decoded)
-
-                caterer = CatererAccount.objects.filter(owner=request.user).first()
+
+                caterer = _get_request_caterer(request)
                 if not caterer:
                     self.message_user(request, "No caterer linked to your account.", level=messages.ERROR)
                     return redirect("..")
 
-                created_count = 0
-                for row in reader:
-                    item_type = row["item_type"].strip().lower()
-                    category_name = row["category"].strip().title()
-                    name = row["name"].strip()
-
-                    category, _ = MenuCategory.objects.get_or_create(
-                        caterer=caterer, name=category_name
+                columns, rows = _read_csv_rows(file)
+                missing_columns = [name for name in _REQUIRED_CSV_COLUMNS if name not in columns]
+                if missing_columns:
+                    self.message_user(
+                        request,
+                        f"CSV is missing required columns: {', '.join(missing_columns)}",
+                        level=messages.ERROR,
                     )
+                    return redirect("..")
+                item_type_col = columns["item_type"]
+                category_col = columns["category"]
+                name_col = columns["name"]
+                required_positions = [columns[name] for name in _REQUIRED_CSV_COLUMNS]
+                short_rows = [
+                    str(number)
+                    for number, row in enumerate(rows, start=1)
+                    if any(_csv_cell(row, position) is None for position in required_positions)
+                ]
+                if short_rows:
+                    shown = ", ".join(short_rows[:10]) + (", ..." if len(short_rows) > 10 else "")
+                    self.message_user(
+                        request,
+                        f"Some CSV rows are missing item_type, category or name (data rows: {shown}). Nothing was imported.",
+                        level=messages.ERROR,
+                    )
+                    return redirect("..")
+                column = columns.get
+                description_col = column("description")
+                sort_override_col = column("sort_order_override")
+                cost_col = column("cost_per_serving")
+                markup_col = column("markup")
+                servings_col = column("default_servings_per_person")
+                is_active_col = column("is_active")
+                with transaction.atomic():
+                    # Normalize each distinct category cell once, not once per row.
+                    category_labels = {
+                        raw: raw.strip().title() for raw in {_csv_cell(row, category_col) for row in rows}
+                    }
+                    category_names = set(category_labels.values())
+                    categories = {
+                        category.name: category
+                        for category in MenuCategory.objects.filter(caterer=caterer, name__in=category_names)
+                    }
+                    missing_names = category_names - categories.keys()
+                    if missing_names:
+                        # A concurrent import may create the same names; the unique
+                        # (caterer, name) pair turns that into a no-op, then re-read.
+                        MenuCategory.objects.bulk_create(
+                            [MenuCategory(caterer=caterer, name=name) for name in missing_names],
+                            ignore_conflicts=True,
+                        )
+                        categories.update(
+                            (category.name, category)
+                            for category in MenuCategory.objects.filter(caterer=caterer, name__in=missing_names)
+                        )
 
-                    def parse_decimal(value, default="0.0"):
-                        try:
-                            return Decimal(value.strip()) if value and str(value).strip() else Decimal(default)
-                        except (InvalidOperation, AttributeError):
-                            return Decimal(default)
-
-                    def parse_int(value):
-                        try:
-                            raw = str(value).strip() if value is not None else ""
-                            if not raw:
-                                return None
-                            return int(Decimal(raw))
-                        except (InvalidOperation, ValueError):
-                            return None
-
-                    cost = parse_decimal(row.get("cost_per_serving"), "0.0")
-                    markup = parse_decimal(row.get("markup"), str(caterer.default_food_markup))
-                    if markup == Decimal("0.0"):
-                        markup = caterer.default_food_markup
-                    servings = parse_decimal(row.get("default_servings_per_person"), "1.0")
-                    is_active = str(row.get("is_active", "true")).lower() == "true"
-                    sort_override = parse_int(row.get("sort_order_override"))
-
-                    if item_type == "food":
-                        MenuItem.objects.create(
-                            caterer=caterer,
-                            category=category,
-                            name=name,
-                            description=row.get("description", ""),
-                            sort_order_override=sort_override,
-                            cost_per_serving=cost,
-                            markup=markup,
-                            default_servings_per_person=servings,
-                            is_active=is_active,
+                    caterer_id = caterer.pk
+                    default_markup = caterer.default_food_markup
+                    food_rows = []
+                    extra_rows = []
+                    for row in rows:
+                        if _csv_cell(row, item_type_col).strip().lower() == "food":
+                            food_rows.append(row)
+                        else:
+                            extra_rows.append(row)
+
+                    menu_items = []
+                    for row in food_rows:
+                        menu_items.append(
+                            MenuItem(
+                                caterer_id=caterer_id,
+                                category=categories[category_labels[_csv_cell(row, category_col)]],
+                                name=_csv_cell(row, name_col).strip(),
+                                description=_csv_cell(row, description_col, ""),
+                                sort_order_override=_parse_int(_csv_cell(row, sort_override_col)),
+                                cost_per_serving=_parse_decimal(_csv_cell(row, cost_col)),
+                                markup=_parse_decimal(_csv_cell(row, markup_col), default_markup) or default_markup,
+                                default_servings_per_person=_parse_decimal(_csv_cell(row, servings_col), _ONE),
+                                is_active=(_csv_cell(row, is_active_col) or "true").strip().lower() in _TRUTHY,
+                            )
                         )
-                    else:
-                        ExtraItem.objects.create(
-                            caterer=caterer,
-                            name=name,
-                            category="RENTAL",
-                            charge_type="PER_EVENT",
-                            price=(cost * markup).quantize(Decimal("0.01")),
-                            cost=cost,
-                            is_active=is_active,
+
+                    extra_items = []
+                    for row in extra_rows:
+                        cost = _parse_decimal(_csv_cell(row, cost_col))
+                        markup = _parse_decimal(_csv_cell(row, markup_col), default_markup) or default_markup
+                        extra_items.append(
+                            ExtraItem(
+                                caterer_id=caterer_id,
+                                name=_csv_cell(row, name_col).strip(),
+                                category="RENTAL",
+                                charge_type="PER_EVENT",
+                                price=(cost * markup).quantize(TWO_PLACES),
+                                cost=cost,
+                                is_active=(_csv_cell(row, is_active_col) or "true").strip().lower() in _TRUTHY,
+                            )
                         )
-                    created_count += 1
+
+                    MenuItem.objects.bulk_create(menu_items, batch_size=500)
+                    ExtraItem.objects.bulk_create(extra_items, batch_size=500)
+                created_count = len(menu_items) + len(extra_items)
 
                 self.message_user(
                     request,
@@ -1076,73 +1292,130 @@ class TrialRequestAdmin(admin.ModelAdmin):
         )
 
     def download_template(self, request):
-        headers = [
-            "item_type",
-            "category",
-            "name",
-            "description",
-            "sort_order_override",
-            "cost_per_serving",
-            "markup",
-            "default_servings_per_person",
-            "is_active",
-        ]
-        sample_rows = [
-            ["Food", "Starters", "Smoked Salmon Bites", "Mini bagels with lox", "1", "12.50", "3.0", "1.0", "True"],
-            ["Food", "Mains", "Steak Strip", "Grilled steak strips", "", "28.00", "", "1.0", "True"],
-            ["Extra", "Rental", "Projector", "", "", "400", "3.0", "1.0", "True"],
-        ]
-
-        response = HttpResponse(content_type="text/csv")
+        response = HttpResponse(_MENU_TEMPLATE_CSV, content_type="text/csv")
         response["Content-Disposition"] = 'attachment; filename="menu_template.csv"'
-        writer = csv.writer(response)
-        writer.writerow(headers)
-        for row in sample_rows:
-            writer.writerow(row)
         return response
 
 # ==========================
 # EXTRA ITEM ADMIN
 # ==========================
 @admin.register(ExtraItem)
-class ExtraItemAdmin(admin.ModelAdmin):
+class ExtraItemAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("name", "caterer", "category", "charge_type", "price", "is_active")
-    list_filter = ("caterer", "category", "charge_type", "is_active")
+    list_filter = (("caterer", admin.RelatedOnlyFieldListFilter), "category", "charge_type", "is_active")
     search_fields = ("name",)
-
-    def get_queryset(self, request):
-        return limit_to_user_caterer(super().get_queryset(request), request)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    list_select_related = ("caterer",)
+    show_full_result_count = False
+    changelist_only_fields = ("name", "caterer", "category", "charge_type", "price", "is_active")
 
 # ==========================
 # MENU TEMPLATE ADMIN (optional/simple)
 # ==========================
 @admin.register(MenuTemplate)
-class MenuTemplateAdmin(admin.ModelAdmin):
+class MenuTemplateAdmin(CatererScopedAdminMixin, admin.ModelAdmin):
     list_display = ("name", "caterer", "menu_type", "created_at")
     list_filter = ("menu_type", "caterer")
-    filter_horizontal = ("items",)
-
-    def get_queryset(self, request):
-        qs = super().get_queryset(request)
-        if request.user.is_superuser:
-            return qs
-        return qs.filter(caterer__owner=request.user)
-
-    def get_form(self, request, obj=None, **kwargs):
-        form = super().get_form(request, obj, **kwargs)
-        if not request.user.is_superuser:
-            form.base_fields["caterer"].queryset = CatererAccount.objects.filter(owner=request.user)
-        return form
+    autocomplete_fields = ("items",)
+    list_select_related = ("caterer",)
 
 # ==========================
 # ESTIMATE ADMIN – CHECKLIST + TEMPLATES
 # ==========================
+def _estimate_line_prefetches():
+    """
+    Food choices and extra lines in print order, for the estimate print and workflow views.
+    """
+    return (
+        Prefetch(
+            "food_choices",
+            queryset=EstimateFoodChoice.objects.select_related("menu_item__category").order_by(
+                *FOOD_CHOICE_MENU_ORDER
+            ),
+        ),
+        Prefetch(
+            "extra_lines",
+            queryset=EstimateExtraItem.objects.select_related("extra_item").order_by(
+                "extra_item__category", "extra_item__name"
+            ),
+        ),
+    )
+
+
+def _workflow_line_prefetches():
+    """
+    Narrow variant of _estimate_line_prefetches() with only the columns the workflow sheet prints.
+    """
+    return (
+        Prefetch(
+            "food_choices",
+            queryset=EstimateFoodChoice.objects.select_related("menu_item__category")
+            .only(
+                "estimate",
+                "meal_name",
+                "notes",
+                "menu_item__name",
+                "menu_item__category__name",
+                "menu_item__category__sort_order",
+            )
+            .order_by(*FOOD_CHOICE_MENU_ORDER),
+        ),
+        Prefetch(
+            "extra_lines",
+            queryset=EstimateExtraItem.objects.select_related("extra_item")
+            .only("estimate", "notes", "extra_item__name", "extra_item__category")
+            .order_by("extra_item__category", "extra_item__name"),
+        ),
+    )
+
+
+class _RowValueField(forms.DecimalField):
+    """
+    A checklist value (servings, quantity, override price) whose row may be unticked;
+    EstimateAdminForm sets skip_clean on those so they clean to None without validation.
+    """
+
+    skip_clean = False
+
+    def clean(self, value):
+        if self.skip_clean:
+            return None
+        return super().clean(value)
+
+
+# Prototypes for the per-item checklist fields. Shallow copies share the widget
+# and validators, which are never mutated after construction.
+_INCLUDE_FIELD = forms.BooleanField(required=False)
+_SERVINGS_FIELD = _RowValueField(
+    max_digits=5,
+    decimal_places=2,
+    required=False,
+    label="Servings per person",
+    widget=forms.HiddenInput(),
+)
+_EXTRA_QUANTITY_FIELD = _RowValueField(
+    max_digits=8,
+    decimal_places=2,
+    required=False,
+    label="Quantity",
+    min_value=Decimal("0.00"),
+)
+_EXTRA_OVERRIDE_FIELD = _RowValueField(
+    max_digits=10,
+    decimal_places=2,
+    required=False,
+    label="Override price",
+    help_text="Leave blank to use the catalog price.",
+)
+
+
+def _clone_field(prototype, initial, label=None):
+    field = copy.copy(prototype)
+    field.initial = initial
+    if label is not None:
+        field.label = label
+    return field
+
+
 class EstimateAdminForm(forms.ModelForm):
     menu_type = "STANDARD"
     meal_plan_input = forms.CharField(
@@ -1178,9 +1451,13 @@ class EstimateAdminForm(forms.ModelForm):
         model = Estimate
         fields = "__all__"
 
+    # Set on the per-request class returned by EstimateAdmin.get_form; a request kwarg overrides it.
+    request = None
+
     def __init__(self, *args, **kwargs):
-        # custom hook to get request
-        self.request = kwargs.pop("request", None)
+        request = kwargs.pop("request", None)
+        if request is not None:
+            self.request = request
         super().__init__(*args, **kwargs)
         menu_type = getattr(self, "menu_type", "STANDARD")
 
@@ -1189,9 +1466,7 @@ class EstimateAdminForm(forms.ModelForm):
         if self.instance and self.instance.pk and self.instance.caterer_id:
             caterer = self.instance.caterer
         elif self.request:
-            caterer = (
-                CatererAccount.objects.filter(owner=self.request.user).first()
-            )
+            caterer = _get_request_caterer(self.request)
             if caterer and not self.instance.pk:
                 self.fields["caterer"].initial = caterer
                 if "payment_terms" in self.fields and not self.fields["payment_terms"].initial:
@@ -1211,17 +1486,22 @@ class EstimateAdminForm(forms.ModelForm):
 
         # Limit use_template queryset
         if caterer:
-            self.fields["use_template"].queryset = MenuTemplate.objects.filter(
-                caterer=caterer,
-                menu_type=menu_type,
+            # Option labels come from MenuTemplate.__str__, which reads the caterer's name.
+            self.fields["use_template"].queryset = (
+                MenuTemplate.objects.filter(caterer=caterer, menu_type=menu_type)
+                .select_related("caterer")
+                .only("id", "name", "caterer__id", "caterer__name")
             )
         else:
             self.fields["use_template"].queryset = MenuTemplate.objects.none()
 
         # Determine meals
         raw_meal_input = self.data.get("meal_plan_input") if self.data else None
+        # Reused by EstimateAdmin.save_model so the posted plan is parsed once.
+        self._parsed_meals = None
         if raw_meal_input:
             meal_names = parse_meal_plan(raw_meal_input)
+            self._parsed_meals = meal_names
         elif self.instance and self.instance.meal_plan:
             meal_names = self.instance.get_meal_plan()
         else:
@@ -1248,6 +1528,8 @@ class EstimateAdminForm(forms.ModelForm):
 
         # Build dynamic item checklist
         self.menu_items = []
+        # (item, meal index, include field, servings field), reused by EstimateAdmin.save_model
+        self._food_field_names = []
         if caterer:
             menu_qs = (
                 MenuItem.objects.filter(
@@ -1256,6 +1538,18 @@ class EstimateAdminForm(forms.ModelForm):
                     menu_type=menu_type,
                 )
                 .select_related("category")
+                # Only what the checklist template and save_model read.
+                .only(
+                    "id",
+                    "name",
+                    "description",
+                    "cost_per_serving",
+                    "markup",
+                    "default_servings_per_person",
+                    "category__id",
+                    "category__name",
+                    "category__sort_order",
+                )
                 .order_by(
                     F("category__sort_order").asc(nulls_last=True),
                     F("category__name").asc(nulls_last=True),
@@ -1265,15 +1559,22 @@ class EstimateAdminForm(forms.ModelForm):
             )
             existing_choices = {}
             if self.instance and self.instance.pk:
-                for ch in self.instance.food_choices.all():
-                    key = (ch.menu_item_id, ch.meal_name or self.instance.default_meal_name())
+                default_meal = self.instance.default_meal_name()
+                for ch in self.instance.food_choices.only("menu_item_id", "meal_name", "servings_per_person"):
+                    key = (ch.menu_item_id, ch.meal_name or default_meal)
                     existing_choices[key] = ch
 
-            for item in menu_qs:
+            meal_suffixes = [f"_meal_{idx}" for idx in range(len(self.meal_names))]
+            # Collected locally and merged into self.fields once after the loop.
+            food_fields = {}
+            for item in menu_qs.iterator(chunk_size=200):
                 self.menu_items.append(item)
+                include_prefix = f"include_item_{item.id}"
+                servings_prefix = f"servings_item_{item.id}"
                 for idx, meal_name in enumerate(self.meal_names):
-                    include_name = f"include_item_{item.id}_meal_{idx}"
-                    servings_name = f"servings_item_{item.id}_meal_{idx}"
+                    include_name = include_prefix + meal_suffixes[idx]
+                    servings_name = servings_prefix + meal_suffixes[idx]
+                    self._food_field_names.append((item, idx, include_name, servings_name))
 
                     existing_key = (item.id, meal_name)
                     included_initial = existing_key in existing_choices
@@ -1282,19 +1583,11 @@ class EstimateAdminForm(forms.ModelForm):
                     else:
                         servings_initial = item.default_servings_per_person
 
-                    self.fields[include_name] = forms.BooleanField(
-                        label=f"{item.name} ({meal_name})",
-                        required=False,
-                        initial=included_initial,
-                    )
-                    self.fields[servings_name] = forms.DecimalField(
-                        max_digits=5,
-                        decimal_places=2,
-                        required=False,
-                        initial=servings_initial,
-                        label="Servings per person",
-                        widget=forms.HiddenInput(),
+                    food_fields[include_name] = _clone_field(
+                        _INCLUDE_FIELD, included_initial, label=f"{item.name} ({meal_name})"
                     )
+                    food_fields[servings_name] = _clone_field(_SERVINGS_FIELD, servings_initial)
+            self.fields.update(food_fields)
         else:
             self.menu_items = []
 
@@ -1302,6 +1595,8 @@ class EstimateAdminForm(forms.ModelForm):
         self.decor_items = []
         self.addon_items = []
         self.extra_items = []
+        # (extra, include field, quantity field, override field), reused by EstimateAdmin.save_model
+        self._extra_field_names = []
         if caterer:
             extra_qs = (
                 ExtraItem.objects.filter(
@@ -1310,52 +1605,50 @@ class EstimateAdminForm(forms.ModelForm):
                 )
                 .order_by("category", "name")
             )
+            # extra_item_id -> (quantity, override_price); extra_item isn't unique per estimate, so no in_bulk()
             existing_lines = {}
             if self.instance and self.instance.pk:
-                for line in self.instance.extra_lines.all():
-                    existing_lines[line.extra_item_id] = line
+                existing_lines = {
+                    extra_item_id: (quantity, override_price)
+                    for extra_item_id, quantity, override_price in self.instance.extra_lines.values_list(
+                        "extra_item_id", "quantity", "override_price"
+                    )
+                }
 
-            for extra in extra_qs:
+            extra_fields = {}
+            for extra in extra_qs.iterator(chunk_size=200):
                 include_name = f"include_extra_{extra.id}"
                 quantity_name = f"quantity_extra_{extra.id}"
                 override_name = f"override_extra_{extra.id}"
+                self._extra_field_names.append((extra, include_name, quantity_name, override_name))
 
                 existing_line = existing_lines.get(extra.id)
                 included_initial = existing_line is not None
-                quantity_initial = (
-                    existing_line.quantity if existing_line else Decimal("1.00")
-                )
-                override_initial = (
-                    existing_line.override_price if existing_line else None
-                )
+                quantity_initial = existing_line[0] if existing_line else Decimal("1.00")
+                override_initial = existing_line[1] if existing_line else None
 
-                self.fields[include_name] = forms.BooleanField(
-                    label=f"{extra.name}",
-                    required=False,
-                    initial=included_initial,
-                )
-                self.fields[quantity_name] = forms.DecimalField(
-                    max_digits=8,
-                    decimal_places=2,
-                    required=False,
-                    initial=quantity_initial,
-                    label="Quantity",
-                    min_value=Decimal("0.00"),
-                )
-                self.fields[override_name] = forms.DecimalField(
-                    max_digits=10,
-                    decimal_places=2,
-                    required=False,
-                    initial=override_initial,
-                    label="Override price",
-                    help_text="Leave blank to use the catalog price.",
+                extra_fields[include_name] = _clone_field(
+                    _INCLUDE_FIELD, included_initial, label=f"{extra.name}"
                 )
+                extra_fields[quantity_name] = _clone_field(_EXTRA_QUANTITY_FIELD, quantity_initial)
+                extra_fields[override_name] = _clone_field(_EXTRA_OVERRIDE_FIELD, override_initial)
 
                 self.extra_items.append(extra)
                 if extra.category in ("DECOR", "RENTAL"):
                     self.decor_items.append(extra)
                 else:
                     self.addon_items.append(extra)
+            self.fields.update(extra_fields)
+
+        # save_model only reads the values of ticked rows, so don't clean the rest.
+        if self.is_bound:
+            for _item, _idx, include_name, servings_name in self._food_field_names:
+                if not self[include_name].data:
+                    self.fields[servings_name].skip_clean = True
+            for _extra, include_name, quantity_name, override_name in self._extra_field_names:
+                if not self[include_name].data:
+                    self.fields[quantity_name].skip_clean = True
+                    self.fields[override_name].skip_clean = True
 
         # Suggestions for remembered options
         self.tablecloth_options = []
@@ -1384,13 +1677,13 @@ class KiddushEstimateAdminForm(EstimateAdminForm):
     menu_type = "KIDDUSH"
 
     def __init__(self, *args, **kwargs):
-        request = kwargs.get("request")
+        request = kwargs.get("request") or self.request
         instance = kwargs.get("instance")
         caterer = None
         if instance and instance.pk and instance.caterer_id:
             caterer = instance.caterer
         elif request:
-            caterer = CatererAccount.objects.filter(owner=request.user).first()
+            caterer = _get_request_caterer(request)
         if caterer:
             ensure_kiddush_menu(caterer)
         super().__init__(*args, **kwargs)
@@ -1419,6 +1712,17 @@ class EstimateAdmin(admin.ModelAdmin):
     )
     list_filter = ("event_date", "caterer", "is_invoice")
     search_fields = ("customer_name", "event_type")
+    _CHANGELIST_DEFER = (
+        "notes_internal",
+        "notes_for_customer",
+        "payment_instructions",
+        "payment_terms",
+        "contract_terms",
+        "tablecloth_details",
+        "meal_service_details",
+        "meal_guest_overrides",
+        "manual_meal_totals",
+    )
 
     fieldsets = (
         (
@@ -1514,7 +1818,9 @@ class EstimateAdmin(admin.ModelAdmin):
     actions = ["delete_selected", "workflow_bulk_action"]
 
     def get_queryset(self, request):
-        qs = limit_to_user_caterer(super().get_queryset(request), request)
+        qs = super().get_queryset(request).select_related("caterer", "caterer__owner")
+        qs = _changelist_defer(qs, request, self._CHANGELIST_DEFER)
+        qs = limit_to_user_caterer(qs, request)
         if self.estimate_type:
             qs = qs.filter(estimate_type=self.estimate_type)
         return qs
@@ -1525,8 +1831,10 @@ class EstimateAdmin(admin.ModelAdmin):
     def _admin_reverse(self, suffix, args=None):
         return reverse(f"admin:{self._admin_url_name(suffix)}", args=args)
 
-    def _get_estimate(self, estimate_id):
+    def _get_estimate(self, estimate_id, prefetch_lines=False):
         qs = Estimate.objects.select_related("caterer", "caterer__owner")
+        if prefetch_lines:
+            qs = qs.prefetch_related(*_estimate_line_prefetches())
         if self.estimate_type:
             qs = qs.filter(estimate_type=self.estimate_type)
         return qs.get(pk=estimate_id)
@@ -1568,20 +1876,12 @@ class EstimateAdmin(admin.ModelAdmin):
         Inject `request` into the form so it can know which caterer/user.
         Also limit caterer choices to the current user's caterer.
         """
-        base_form = self.form
-
-        class FormWithRequest(base_form):
-            def __init__(self2, *a, **kw):
-                kw["request"] = request
-                super().__init__(*a, **kw)
-
-        kwargs["form"] = FormWithRequest
         form_class = super().get_form(request, obj, **kwargs)
+        # modelform_factory builds a fresh subclass on every call, so this stays per-request.
+        form_class.request = request
 
         if not request.user.is_superuser and "caterer" in form_class.base_fields:
-            form_class.base_fields["caterer"].queryset = CatererAccount.objects.filter(
-                owner=request.user
-            )
+            form_class.base_fields["caterer"].queryset = _user_caterer_qs(request)
 
         return form_class
 
@@ -1655,78 +1955,108 @@ class EstimateAdmin(admin.ModelAdmin):
         Save the Estimate, then build EstimateFoodChoice rows based on
         the checkbox selection and template usage. Also optionally save a new template.
         """
+        cleaned_data = form.cleaned_data
         is_new = obj.pk is None
         if self.estimate_type:
             obj.estimate_type = self.estimate_type
         if is_new or not obj.estimate_number:
-            counter = obj.caterer.estimate_number_counter or 1000
-            obj.estimate_number = counter
-            obj.caterer.estimate_number_counter = counter + 1
-            obj.caterer.save(update_fields=["estimate_number_counter"])
+            obj.estimate_number = obj.caterer.reserve_estimate_number()
 
-        meal_names = parse_meal_plan(form.cleaned_data.get("meal_plan_input"))
+        meal_names = getattr(form, "_parsed_meals", None) or parse_meal_plan(
+            cleaned_data.get("meal_plan_input")
+        )
         if not meal_names:
             meal_names = ["Signature Menu"]
         obj.meal_plan = meal_names
 
-        overrides_raw = form.cleaned_data.get("manual_meal_totals_json")
+        overrides_raw = cleaned_data.get("manual_meal_totals_json")
         try:
             obj.manual_meal_totals = json.loads(overrides_raw) if overrides_raw else {}
         except json.JSONDecodeError:
             obj.manual_meal_totals = {}
-        guest_overrides_raw = form.cleaned_data.get("meal_guest_overrides_json")
+        guest_overrides_raw = cleaned_data.get("meal_guest_overrides_json")
         try:
             obj.meal_guest_overrides = json.loads(guest_overrides_raw) if guest_overrides_raw else {}
         except json.JSONDecodeError:
             obj.meal_guest_overrides = {}
-        service_raw = form.cleaned_data.get("meal_service_json")
+        service_raw = cleaned_data.get("meal_service_json")
         try:
             obj.meal_service_details = json.loads(service_raw) if service_raw else {}
         except json.JSONDecodeError:
             obj.meal_service_details = {}
         obj.tablecloth_details = self._parse_tablecloths(
-            form.cleaned_data.get("tablecloth_details"),
+            cleaned_data.get("tablecloth_details"),
             meal_names,
         )
 
-        super().save_model(request, obj, form, change)
+        # Totals depend on the line items rebuilt below; they're computed once at the end.
+        obj.save(recalc=False)
 
         menu_items = getattr(form, "menu_items", [])
         selected_entries = []
 
         # Collect explicit checkbox selections
-        for item in menu_items:
-            for idx, meal_name in enumerate(meal_names):
-                include_name = f"include_item_{item.id}_meal_{idx}"
-                servings_name = f"servings_item_{item.id}_meal_{idx}"
-                if form.cleaned_data.get(include_name):
-                    servings = form.cleaned_data.get(servings_name) or item.default_servings_per_person
-                    selected_entries.append((item, meal_name, servings))
+        meal_count = len(meal_names)
+        for item, idx, include_name, servings_name in getattr(form, "_food_field_names", []):
+            if idx < meal_count and cleaned_data.get(include_name):
+                servings = cleaned_data.get(servings_name) or item.default_servings_per_person
+                selected_entries.append((item, meal_names[idx], servings))
 
         # If a template was chosen and nothing selected manually, use template for primary meal
-        use_template = form.cleaned_data.get("use_template")
+        use_template = cleaned_data.get("use_template")
         if use_template and not selected_entries:
             template_item_ids = list(use_template.items.values_list("id", flat=True))
+            menu_by_id = {m.id: m for m in menu_items}
+            missing_ids = [mid for mid in template_item_ids if mid not in menu_by_id]
+            if missing_ids:
+                menu_by_id.update(MenuItem.objects.in_bulk(missing_ids))
             for mid in template_item_ids:
-                try:
-                    mi = next(m for m in menu_items if m.id == mid)
-                except StopIteration:
-                    mi = MenuItem.objects.get(id=mid)
+                mi = menu_by_id[mid]
                 selected_entries.append((mi, meal_names[0], mi.default_servings_per_person))
 
-        # Replace existing food choices
-        EstimateFoodChoice.objects.filter(estimate=obj).delete()
-        for item, meal_name, servings in selected_entries:
-            EstimateFoodChoice.objects.create(
-                estimate=obj,
-                menu_item=item,
-                included=True,
-                servings_per_person=servings,
-                meal_name=meal_name,
+        # Sync food choices: drop unselected rows, insert new ones, update changed servings
+        selected = {(item.id, meal_name): (item, servings) for item, meal_name, servings in selected_entries}
+        with transaction.atomic():
+            kept = {}
+            stale_ids = []
+            existing_choices = EstimateFoodChoice.objects.filter(estimate=obj).only(
+                "id", "menu_item_id", "meal_name", "servings_per_person", "included"
+            )
+            for choice in existing_choices:
+                key = (choice.menu_item_id, choice.meal_name)
+                if key in selected and key not in kept:
+                    kept[key] = choice
+                else:
+                    stale_ids.append(choice.pk)
+            changed = []
+            for key, choice in kept.items():
+                servings = selected[key][1]
+                if choice.servings_per_person != servings or not choice.included:
+                    choice.servings_per_person = servings
+                    choice.included = True
+                    changed.append(choice)
+
+            if stale_ids:
+                EstimateFoodChoice.objects.filter(pk__in=stale_ids).delete()
+            EstimateFoodChoice.objects.bulk_create(
+                [
+                    EstimateFoodChoice(
+                        estimate=obj,
+                        menu_item=item,
+                        included=True,
+                        servings_per_person=servings,
+                        meal_name=meal_name,
+                    )
+                    for (_item_id, meal_name), (item, servings) in selected.items()
+                    if (_item_id, meal_name) not in kept
+                ],
+                batch_size=500,
             )
+            if changed:
+                EstimateFoodChoice.objects.bulk_update(changed, ["servings_per_person", "included"], batch_size=500)
 
         # Optionally save current selection as a new template
-        template_name = form.cleaned_data.get("save_as_template")
+        template_name = cleaned_data.get("save_as_template")
         if template_name and selected_entries:
             caterer = obj.caterer
             tmpl, created = MenuTemplate.objects.get_or_create(
@@ -1734,35 +2064,42 @@ class EstimateAdmin(admin.ModelAdmin):
                 name=template_name,
                 menu_type=self.menu_type,
             )
-            tmpl.items.set(MenuItem.objects.filter(id__in=[item.id for item, _, _ in selected_entries]))
+            tmpl.items.set({item_id for item_id, _meal_name in selected})
 
         # Replace extra items based on wizard selections
         extra_items = getattr(form, "extra_items", [])
         if extra_items:
-            EstimateExtraItem.objects.filter(estimate=obj).delete()
-            for extra in extra_items:
-                include_name = f"include_extra_{extra.id}"
-                quantity_name = f"quantity_extra_{extra.id}"
-                override_name = f"override_extra_{extra.id}"
-
-                if not form.cleaned_data.get(include_name):
+            extra_lines = []
+            for extra, include_name, quantity_name, override_name in getattr(form, "_extra_field_names", []):
+                if not cleaned_data.get(include_name):
                     continue
 
-                quantity = form.cleaned_data.get(quantity_name) or Decimal("1.00")
-                override_price = form.cleaned_data.get(override_name)
-                EstimateExtraItem.objects.create(
-                    estimate=obj,
-                    extra_item=extra,
-                    quantity=quantity,
-                    override_price=override_price,
+                quantity = cleaned_data.get(quantity_name) or Decimal("1.00")
+                override_price = cleaned_data.get(override_name)
+                extra_lines.append(
+                    EstimateExtraItem(
+                        estimate=obj,
+                        extra_item=extra,
+                        quantity=quantity,
+                        override_price=override_price,
+                    )
                 )
+            with transaction.atomic():
+                EstimateExtraItem.objects.filter(estimate=obj).delete()
+                EstimateExtraItem.objects.bulk_create(extra_lines, batch_size=500)
         self._remember_material_choices(
             obj.caterer,
             obj.tablecloth_details,
-            form.cleaned_data.get("plasticware_color"),
+            cleaned_data.get("plasticware_color"),
         )
+        self._ensure_fixed_lines(obj)
         # After rebuilding related rows, recalc totals now that selections exist
-        obj.save()
+        obj.save(update_fields=DERIVED_TOTALS_FIELDS)
+
+    def _ensure_fixed_lines(self, obj):
+        """
+        Hook for line items an estimate type always carries, added before totals are computed.
+        """
 
     def get_urls(self):
         urls = super().get_urls()
@@ -2219,22 +2556,19 @@ class EstimateAdmin(admin.ModelAdmin):
         return render(request, "admin/estimate_planner_print.html", context)
 
     def print_estimate(self, request, estimate_id):
-        estimate = self._get_estimate(estimate_id)
+        estimate = self._get_estimate(estimate_id, prefetch_lines=True)
         if not request.user.is_superuser and estimate.caterer.owner != request.user:
             raise PermissionDenied("You do not have access to this estimate.")
         estimate.recalc_totals()
 
-        extra_lines = (
-            estimate.extra_lines.select_related("extra_item")
-            .order_by("extra_item__category", "extra_item__name")
-        )
-        fx_rate = (estimate.exchange_rate or Decimal("1.00"))
+        extra_lines = estimate.extra_lines.all()
+        fx_rate = (estimate.exchange_rate or UNIT_RATE)
         extras_rows = []
         for line in extra_lines:
             base_price = line.override_price if line.override_price is not None else line.extra_item.price
             display_price = None
             if base_price is not None:
-                display_price = (base_price * fx_rate).quantize(Decimal("0.01"))
+                display_price = (base_price * fx_rate).quantize(TWO_PLACES)
             extras_rows.append(
                 {
                     "name": line.extra_item.name,
@@ -2242,7 +2576,7 @@ class EstimateAdmin(admin.ModelAdmin):
                     "notes": line.notes,
                     "charge_type": line.extra_item.get_charge_type_display(),
                     "price": display_price,
-                    "is_included": display_price in (None, Decimal("0.00")),
+                    "is_included": display_price in (None, ZERO_MONEY),
                 }
             )
 
@@ -2250,25 +2584,25 @@ class EstimateAdmin(admin.ModelAdmin):
         show_delivery_fee = any(row.get("wants_real_dishes") for row in per_meal_service_rows)
         delivery_fee = (
             estimate.real_dishes_flat_fee
-            or (estimate.caterer.real_dishes_flat_fee if estimate.caterer_id else Decimal("0.00"))
-            or Decimal("0.00")
+            or (estimate.caterer.real_dishes_flat_fee if estimate.caterer_id else ZERO_MONEY)
+            or ZERO_MONEY
         )
-        if estimate.exchange_rate and estimate.exchange_rate != Decimal("1.00"):
-            delivery_fee = (delivery_fee * estimate.exchange_rate).quantize(Decimal("0.01"))
-        dishes_delivery_fee = Decimal("0.00")
+        if estimate.exchange_rate and estimate.exchange_rate != UNIT_RATE:
+            delivery_fee = (delivery_fee * estimate.exchange_rate).quantize(TWO_PLACES)
+        dishes_delivery_fee = ZERO_MONEY
         dishes_subtotal = estimate.dishes_total
         if estimate.dishes_total:
             dishes_delivery_fee = min(delivery_fee, estimate.dishes_total)
-            dishes_subtotal = (estimate.dishes_total - dishes_delivery_fee).quantize(Decimal("0.01"))
+            dishes_subtotal = (estimate.dishes_total - dishes_delivery_fee).quantize(TWO_PLACES)
         caterer = estimate.caterer
         staff_context = None
         if not estimate.is_ala_carte:
             waiters = estimate.total_waiter_count()
             rate = estimate._get_staff_hourly_rate()
             if per_meal_service_rows:
-                staff_hours = sum((row["staff_hours"] for row in per_meal_service_rows), Decimal("0.00")).quantize(Decimal("0.01"))
-                staff_pay = sum((row["staff_pay_total"] for row in per_meal_service_rows), Decimal("0.00")).quantize(Decimal("0.01"))
-                staff_tip = sum((row["staff_tip_total"] for row in per_meal_service_rows), Decimal("0.00")).quantize(Decimal("0.01"))
+                staff_hours = sum((row["staff_hours"] for row in per_meal_service_rows), ZERO_MONEY).quantize(TWO_PLACES)
+                staff_pay = sum((row["staff_pay_total"] for row in per_meal_service_rows), ZERO_MONEY).quantize(TWO_PLACES)
+                staff_tip = sum((row["staff_tip_total"] for row in per_meal_service_rows), ZERO_MONEY).quantize(TWO_PLACES)
                 waiter_set = {row["wait_staff_count"] for row in per_meal_service_rows}
                 waiter_value = waiter_set.pop() if len(waiter_set) == 1 else None
                 tip_set = {row["staff_tip_per_waiter"] for row in per_meal_service_rows}
@@ -2279,26 +2613,26 @@ class EstimateAdmin(admin.ModelAdmin):
                     "hours": staff_hours,
                     "hourly_rate": rate,
                     "labor_total": staff_pay,
-                    "tip_per_waiter": Decimal("0.00") if estimate.client_tipped_at_event else tip_value,
+                    "tip_per_waiter": ZERO_MONEY if estimate.client_tipped_at_event else tip_value,
                     "tip_total": staff_tip,
                     "grand": staff_pay + staff_tip,
                     "tip_varies": False if estimate.client_tipped_at_event else tip_value is None,
                     "per_meal": per_meal_service_rows,
                 }
             else:
-                staff_hours = estimate.staff_hours or Decimal("0.00")
+                staff_hours = estimate.staff_hours or ZERO_MONEY
                 tip = estimate._get_staff_tip_per_waiter()
-                staff_pay = (rate * staff_hours * waiters).quantize(Decimal("0.01"))
-                staff_tip = Decimal("0.00")
+                staff_pay = (rate * staff_hours * waiters).quantize(TWO_PLACES)
+                staff_tip = ZERO_MONEY
                 if not estimate.client_tipped_at_event:
-                    staff_tip = (tip * waiters).quantize(Decimal("0.01"))
+                    staff_tip = (tip * waiters).quantize(TWO_PLACES)
                 staff_context = {
                     "waiters": waiters,
                     "waiters_varies": False,
                     "hours": staff_hours,
                     "hourly_rate": rate,
                     "labor_total": staff_pay,
-                    "tip_per_waiter": Decimal("0.00") if estimate.client_tipped_at_event else tip,
+                    "tip_per_waiter": ZERO_MONEY if estimate.client_tipped_at_event else tip,
                     "tip_total": staff_tip,
                     "grand": staff_pay + staff_tip,
                     "tip_varies": False,
@@ -2306,7 +2640,11 @@ class EstimateAdmin(admin.ModelAdmin):
                 }
 
         meal_sections = estimate.meal_sections()
+        meal_total_amount = ZERO_MONEY
+        kids_total_amount = ZERO_MONEY
         for _section in meal_sections:
+            meal_total_amount += _section["total"]
+            kids_total_amount += _section.get("kids_total", ZERO_MONEY)
             _count = sum(len(c.get("choices", [])) for c in _section.get("categories", []))
             _count += sum(len(c.get("choices", [])) for c in _section.get("kids_categories", []))
             _section["line_item_count"] = _count
@@ -2316,16 +2654,6 @@ class EstimateAdmin(admin.ModelAdmin):
                 _section["compact_level"] = "compact"
             else:
                 _section["compact_level"] = ""
-        meal_total_amount = (
-            sum((section["total"] for section in meal_sections), Decimal("0.00"))
-            if meal_sections
-            else Decimal("0.00")
-        )
-        kids_total_amount = (
-            sum((section.get("kids_total", Decimal("0.00")) for section in meal_sections), Decimal("0.00"))
-            if meal_sections
-            else Decimal("0.00")
-        )
         sheet_surface_class = "sheet-surface-transparent" if caterer.document_surface_style == "TRANSPARENT" else ""
         sheet_background_class = f"sheet-bg--{caterer.document_background.lower()}"
         body_theme_class = "theme-bg-clean"
@@ -2376,21 +2704,18 @@ class EstimateAdmin(admin.ModelAdmin):
         return render(request, "admin/estimate_print.html", context)
 
     def print_estimate_flat(self, request, estimate_id):
-        estimate = self._get_estimate(estimate_id)
+        estimate = self._get_estimate(estimate_id, prefetch_lines=True)
         if not request.user.is_superuser and estimate.caterer.owner != request.user:
             raise PermissionDenied("You do not have access to this estimate.")
         estimate.recalc_totals()
-        extra_lines = (
-            estimate.extra_lines.select_related("extra_item")
-            .order_by("extra_item__category", "extra_item__name")
-        )
-        fx_rate = (estimate.exchange_rate or Decimal("1.00"))
+        extra_lines = estimate.extra_lines.all()
+        fx_rate = (estimate.exchange_rate or UNIT_RATE)
         extras_rows = []
         for line in extra_lines:
             base_price = line.override_price if line.override_price is not None else line.extra_item.price
             display_price = None
             if base_price is not None:
-                display_price = (base_price * fx_rate).quantize(Decimal("0.01"))
+                display_price = (base_price * fx_rate).quantize(TWO_PLACES)
             extras_rows.append(
                 {
                     "name": line.extra_item.name,
@@ -2398,45 +2723,51 @@ class EstimateAdmin(admin.ModelAdmin):
                     "notes": line.notes,
                     "charge_type": line.extra_item.get_charge_type_display(),
                     "price": display_price,
-                    "is_included": display_price in (None, Decimal("0.00")),
+                    "is_included": display_price in (None, ZERO_MONEY),
                 }
             )
         per_meal_service_rows = estimate.per_meal_service_summary()
         show_delivery_fee = any(row.get("wants_real_dishes") for row in per_meal_service_rows)
         delivery_fee = (
             estimate.real_dishes_flat_fee
-            or (estimate.caterer.real_dishes_flat_fee if estimate.caterer_id else Decimal("0.00"))
-            or Decimal("0.00")
+            or (estimate.caterer.real_dishes_flat_fee if estimate.caterer_id else ZERO_MONEY)
+            or ZERO_MONEY
         )
         caterer = estimate.caterer
         staff_context = None
         if not estimate.is_ala_carte:
             waiters = estimate.total_waiter_count()
-            staff_hours = estimate.staff_hours or Decimal("0.00")
+            staff_hours = estimate.staff_hours or ZERO_MONEY
             rate = estimate._get_staff_hourly_rate()
             tip = estimate._get_staff_tip_per_waiter()
-            staff_pay = (rate * staff_hours * waiters).quantize(Decimal("0.01"))
-            staff_tip = Decimal("0.00")
+            staff_pay = (rate * staff_hours * waiters).quantize(TWO_PLACES)
+            staff_tip = ZERO_MONEY
             if not estimate.client_tipped_at_event:
-                staff_tip = (tip * waiters).quantize(Decimal("0.01"))
+                staff_tip = (tip * waiters).quantize(TWO_PLACES)
             staff_context = {
                 "waiters": waiters,
                 "waiters_varies": False,
                 "hours": staff_hours,
                 "hourly_rate": rate,
                 "labor_total": staff_pay,
-                "tip_per_waiter": Decimal("0.00") if estimate.client_tipped_at_event else tip,
+                "tip_per_waiter": ZERO_MONEY if estimate.client_tipped_at_event else tip,
                 "tip_total": staff_tip,
                 "grand": staff_pay + staff_tip,
             }
-        dishes_delivery_fee = Decimal("0.00")
+        dishes_delivery_fee = ZERO_MONEY
         dishes_subtotal = estimate.dishes_total
         if estimate.dishes_total:
             dishes_delivery_fee = min(delivery_fee, estimate.dishes_total)
-            dishes_subtotal = (estimate.dishes_total - dishes_delivery_fee).quantize(Decimal("0.01"))
+            dishes_subtotal = (estimate.dishes_total - dishes_delivery_fee).quantize(TWO_PLACES)
 
         meal_sections = estimate.meal_sections()
+        # Flat print folds kids pricing into the meal total.
+        meal_total_amount = ZERO_MONEY
+        kids_total_amount = ZERO_MONEY
         for _section in meal_sections:
+            kids_total = _section.get("kids_total", ZERO_MONEY)
+            meal_total_amount += _section["total"] + kids_total
+            kids_total_amount += kids_total
             _count = sum(len(c.get("choices", [])) for c in _section.get("categories", []))
             _count += sum(len(c.get("choices", [])) for c in _section.get("kids_categories", []))
             _section["line_item_count"] = _count
@@ -2446,16 +2777,6 @@ class EstimateAdmin(admin.ModelAdmin):
                 _section["compact_level"] = "compact"
             else:
                 _section["compact_level"] = ""
-        meal_total_amount = (
-            sum((section["total"] + section.get("kids_total", Decimal("0.00")) for section in meal_sections), Decimal("0.00"))
-            if meal_sections
-            else Decimal("0.00")
-        )
-        kids_total_amount = (
-            sum((section.get("kids_total", Decimal("0.00")) for section in meal_sections), Decimal("0.00"))
-            if meal_sections
-            else Decimal("0.00")
-        )
         sheet_surface_class = "sheet-surface-transparent" if caterer.document_surface_style == "TRANSPARENT" else ""
         sheet_background_class = f"sheet-bg--{caterer.document_background.lower()}"
         body_theme_class = "theme-bg-clean"
@@ -2467,12 +2788,11 @@ class EstimateAdmin(admin.ModelAdmin):
         show_plasticware = bool(estimate.plasticware_color and not estimate.uses_real_dishes_anywhere())
 
         total_guests = (estimate.guest_count or 0) + (estimate.guest_count_kids or 0)
-        per_person = Decimal("0.00")
+        per_person = ZERO_MONEY
         if total_guests:
-            per_person = (estimate.grand_total / Decimal(total_guests)).quantize(Decimal("0.01"))
-        flat_deposit_pct = Decimal("30.00")
+            per_person = (estimate.grand_total / Decimal(total_guests)).quantize(TWO_PLACES)
         flat_deposit_amount = estimate.deposit_amount
-        flat_deposit_pct = estimate.deposit_percentage or Decimal("30.00")
+        flat_deposit_pct = estimate.deposit_percentage or DEFAULT_DEPOSIT_PERCENT
         flat_balance = estimate.balance_due
 
         context = {
@@ -2533,15 +2853,11 @@ class EstimateAdmin(admin.ModelAdmin):
         default_meal = plan[0] if plan else estimate.default_meal_name()
         tablecloth_rows = estimate.tablecloth_rows()
         plasticware_value = estimate.plasticware_color if not estimate.uses_real_dishes_anywhere() else ""
-        choices = list(
-            estimate.food_choices.select_related("menu_item", "menu_item__category")
-            .order_by(
-                F("menu_item__category__sort_order").asc(nulls_last=True),
-                F("menu_item__category__name").asc(nulls_last=True),
-                F("menu_item__sort_order_override").asc(nulls_last=True),
-                "menu_item__name",
+        choices = estimate._prefetched_lines("food_choices")
+        if choices is None:
+            choices = list(
+                estimate.food_choices.select_related("menu_item__category").order_by(*FOOD_CHOICE_MENU_ORDER)
             )
-        )
 
         meal_display = {}
         meal_order_keys = []
@@ -2613,9 +2929,11 @@ class EstimateAdmin(admin.ModelAdmin):
                 }
             )
 
-        extras = list(
-            estimate.extra_lines.select_related("extra_item").order_by("extra_item__category", "extra_item__name")
-        )
+        extras = estimate._prefetched_lines("extra_lines")
+        if extras is None:
+            extras = list(
+                estimate.extra_lines.select_related("extra_item").order_by("extra_item__category", "extra_item__name")
+            )
         if pages and extras:
             pages[-1]["extras"] = extras
 
@@ -2625,6 +2943,7 @@ class EstimateAdmin(admin.ModelAdmin):
         estimate = self._get_estimate(estimate_id)
         if not request.user.is_superuser and estimate.caterer.owner != request.user:
             raise PermissionDenied("You do not have access to this estimate.")
+        prefetch_related_objects([estimate], *_workflow_line_prefetches())
         payload = self._workflow_pages(request, estimate)
         return render(
             request,
@@ -2640,7 +2959,9 @@ class EstimateAdmin(admin.ModelAdmin):
             qs = qs.filter(caterer__owner=request.user)
         if self.estimate_type:
             qs = qs.filter(estimate_type=self.estimate_type)
-        estimates = list(qs.filter(pk__in=id_list).order_by("event_date"))
+        estimates = list(
+            qs.filter(pk__in=id_list).prefetch_related(*_workflow_line_prefetches()).order_by("event_date")
+        )
         if not estimates:
             self.message_user(
                 request,
@@ -2668,58 +2989,56 @@ class EstimateAdmin(admin.ModelAdmin):
         except CatererAccount.DoesNotExist:
             return []
 
-        created = 0
-        created_item_ids = []
+        fallback_markup = Decimal("3.00")
+        default_markup = str(caterer.default_food_markup or fallback_markup)
+        # Group the new_item_<field>_<category id> inputs per category in one pass over POST.
+        new_items = {}
         for key, value in request.POST.items():
-            if not key.startswith("new_item_name_"):
+            if not key.startswith("new_item_"):
                 continue
-            raw_cat_id = key.replace("new_item_name_", "")
-            name = (value or "").strip()
+            field, _sep, raw_cat_id = key[len("new_item_"):].partition("_")
+            if field in _NEW_ITEM_FIELDS:
+                new_items.setdefault(raw_cat_id, {})[field] = value
+        categories = MenuCategory.objects.filter(caterer=caterer).in_bulk(
+            [int(raw_id) for raw_id in new_items if raw_id.isdigit()]
+        )
+        to_create = []
+        for raw_cat_id, fields in new_items.items():
+            name = (fields.get("name") or "").strip()
             if not name:
                 continue
-            desc = (request.POST.get(f"new_item_description_{raw_cat_id}", "") or "").strip()
-            cost_raw = (request.POST.get(f"new_item_cost_{raw_cat_id}", "") or "0").strip()
-            markup_raw = (request.POST.get(f"new_item_markup_{raw_cat_id}", "") or str(caterer.default_food_markup or "3.00")).strip()
-            servings_raw = (request.POST.get(f"new_item_servings_{raw_cat_id}", "") or "1").strip()
-
-            try:
-                cost = Decimal(cost_raw)
-            except InvalidOperation:
-                cost = Decimal("0.00")
-            try:
-                markup = Decimal(markup_raw)
-            except InvalidOperation:
-                markup = Decimal("3.00")
-            try:
-                servings = Decimal(servings_raw)
-            except InvalidOperation:
-                servings = Decimal("1.00")
+            desc = (fields.get("description") or "").strip()
+            cost = _parse_decimal(fields.get("cost"), ZERO_MONEY)
+            # Blank uses the caterer's default; anything unparseable falls back to 3.00.
+            markup = _parse_decimal(fields.get("markup") or default_markup, fallback_markup)
+            servings = _parse_decimal(fields.get("servings"), _ONE)
 
-            category = None
-            if raw_cat_id and raw_cat_id.lower() not in {"none", "null"}:
-                category = MenuCategory.objects.filter(pk=raw_cat_id, caterer=caterer).first()
+            category = categories.get(int(raw_cat_id)) if raw_cat_id.isdigit() else None
 
-            menu_item = MenuItem.objects.create(
-                caterer=caterer,
-                category=category,
-                name=name,
-                description=desc,
-                cost_per_serving=cost,
-                menu_type=self.menu_type,
-                markup=markup,
-                default_servings_per_person=servings,
-                is_active=True,
+            to_create.append(
+                MenuItem(
+                    caterer=caterer,
+                    category=category,
+                    name=name,
+                    description=desc,
+                    cost_per_serving=cost,
+                    menu_type=self.menu_type,
+                    markup=markup,
+                    default_servings_per_person=servings,
+                    is_active=True,
+                )
             )
-            created += 1
-            created_item_ids.append(menu_item.id)
 
-        if created:
-            self.message_user(
-                request,
-                f"Added {created} new menu item(s) to the catalog for this caterer.",
-                level=messages.SUCCESS,
-            )
-        return created_item_ids
+        if not to_create:
+            return []
+        with transaction.atomic():
+            MenuItem.objects.bulk_create(to_create, batch_size=500)
+        self.message_user(
+            request,
+            f"Added {len(to_create)} new menu item(s) to the catalog for this caterer.",
+            level=messages.SUCCESS,
+        )
+        return [item.id for item in to_create]
 
     # Override changeform to allow preview actions (apply meal plan) without saving.
     def _changeform_view(self, request, object_id, form_url, extra_context):
@@ -2922,18 +3241,14 @@ class EstimateAdmin(admin.ModelAdmin):
 
     @staticmethod
     def _default_payment_instructions(caterer):
-        details = [
-            "Please remit the 30% deposit within 48 hours to confirm the booking.",
-        ]
-        if caterer.bank_details:
-            details.append(caterer.bank_details)
-        else:
-            line = "Bank Transfer"
-            if caterer.name:
-                line += f": {caterer.name}"
-            details.append(line)
-        details.append("Reference the event date on your payment so we can match it quickly.")
-        return "\n".join(details)
+        bank_line = caterer.bank_details or (
+            f"Bank Transfer: {caterer.name}" if caterer.name else "Bank Transfer"
+        )
+        return (
+            "Please remit the 30% deposit within 48 hours to confirm the booking.\n"
+            f"{bank_line}\n"
+            "Reference the event date on your payment so we can match it quickly."
+        )
 
 
 @admin.register(KiddushEstimate)
@@ -2980,7 +3295,5 @@ class KiddushEstimateAdmin(EstimateAdmin):
         initial.setdefault("event_type", "Kiddush")
         return initial
 
-    def save_model(self, request, obj, form, change):
-        super().save_model(request, obj, form, change)
+    def _ensure_fixed_lines(self, obj):
         ensure_kiddush_planning_fee_line(obj)
-        obj.save()
@@ -1,9 +1,11 @@
+from itertools import chain
 from pathlib import Path
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.core import serializers
 from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Prefetch
 
 from client_estimates.models import (
     CatererAccount,
@@ -30,8 +32,13 @@ class Command(BaseCommand):
             "--output",
             help="Optional file path for the JSON fixture. Prints to stdout if omitted.",
         )
+        parser.add_argument(
+            "--compact",
+            action="store_true",
+            help="Skip JSON indentation. Roughly halves the fixture size.",
+        )
 
-    def handle(self, username: str, output: str | None = None, **options):
+    def handle(self, username: str, output: str | None = None, compact: bool = False, **options):
         user_model = get_user_model()
         try:
             user = user_model.objects.get(username=username)
@@ -45,43 +52,66 @@ class Command(BaseCommand):
             )
         caterer_ids = [c.pk for c in caterers]
 
+        # App models have no natural keys, so their FKs serialize as raw ids. Only
+        # M2M values and Permission.natural_key() (via content_type) need related rows.
         querysets = [
-            user_model.objects.filter(pk=user.pk),
-            Group.objects.filter(user=user),
-            Permission.objects.filter(user=user),
+            user_model.objects.filter(pk=user.pk).prefetch_related(
+                "groups",
+                Prefetch(
+                    "user_permissions",
+                    queryset=Permission.objects.select_related("content_type"),
+                ),
+            ),
+            Group.objects.filter(user=user).prefetch_related(
+                Prefetch("permissions", queryset=Permission.objects.select_related("content_type"))
+            ),
+            Permission.objects.filter(user=user).select_related("content_type"),
             CatererAccount.objects.filter(pk__in=caterer_ids),
             MenuCategory.objects.filter(caterer_id__in=caterer_ids),
             MenuItem.objects.filter(caterer_id__in=caterer_ids),
-            MenuTemplate.objects.filter(caterer_id__in=caterer_ids),
+            MenuTemplate.objects.filter(caterer_id__in=caterer_ids).prefetch_related(
+                Prefetch("items", queryset=MenuItem.objects.only("pk"))
+            ),
             ExtraItem.objects.filter(caterer_id__in=caterer_ids),
             Estimate.objects.filter(caterer_id__in=caterer_ids),
             EstimateFoodChoice.objects.filter(estimate__caterer_id__in=caterer_ids),
             EstimateExtraItem.objects.filter(estimate__caterer_id__in=caterer_ids),
         ]
 
-        objects = []
-        for qs in querysets:
-            objects.extend(list(qs))
+        exported = 0
 
-        if not objects:
+        def iter_objects():
+            # Stream rows in chunks so the export never holds every object at once.
+            nonlocal exported
+            for qs in querysets:
+                for obj in qs.iterator(chunk_size=2000):
+                    exported += 1
+                    yield obj
+
+        objects = iter_objects()
+        first = next(objects, None)
+        if first is None:
             raise CommandError("Nothing to export.")
+        objects = chain([first], objects)
 
-        payload = serializers.serialize(
-            "json",
-            objects,
-            use_natural_foreign_keys=True,
-            use_natural_primary_keys=True,
-            indent=2,
-        )
+        serializer = serializers.get_serializer("json")()
+        serialize_options = {
+            "use_natural_foreign_keys": True,
+            "use_natural_primary_keys": True,
+            "indent": None if compact else 2,
+        }
 
         if output:
             output_path = Path(output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(payload)
+            with output_path.open("w") as stream:
+                serializer.serialize(objects, stream=stream, **serialize_options)
             self.stdout.write(
                 self.style.SUCCESS(
-                    f"Exported {len(objects)} objects for '{username}' to {output_path}"
+                    f"Exported {exported} objects for '{username}' to {output_path}"
                 )
             )
         else:
-            self.stdout.write(payload)
+            # The serializer writes in pieces; don't let OutputWrapper append newlines to each.
+            self.stdout.ending = None
+            serializer.serialize(objects, stream=self.stdout, **serialize_options)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.shortcuts import redirect
 from django.urls import reverse
 from django.utils import timezone
@@ -10,8 +11,21 @@ class TrialExpiryMiddleware:
     Block expired trial users (non-superusers) and redirect them to the trial expiry page.
     """
 
+    # Paths to ignore to avoid loops
+    ignored_url_names = (
+        "trial_expired",
+        "marketing_home",
+        "start_trial",
+        "admin:login",
+        "admin:logout",
+    )
+    # Asset requests never need the trial check (or the session/user lookup it triggers).
+    asset_suffixes = (".css", ".js", ".map", ".ico", ".png", ".jpg", ".svg", ".woff", ".woff2")
+
     def __init__(self, get_response):
         self.get_response = get_response
+        # Reversed on the first request, once the URLconf and script prefix are in place.
+        self._ignored_prefixes = None
 
     def __call__(self, request):
         response = self.process_request(request)
@@ -20,26 +34,28 @@ class TrialExpiryMiddleware:
         return self.get_response(request)
 
     def process_request(self, request):
-        user = getattr(request, "user", None)
-        if not user or not user.is_authenticated or user.is_superuser:
+        path = request.path
+        if self._ignored_prefixes is None:
+            prefixes = [reverse(name) for name in self.ignored_url_names]
+            prefixes += [settings.STATIC_URL, settings.MEDIA_URL, "/favicon"]
+            self._ignored_prefixes = tuple(prefix for prefix in prefixes if prefix)
+        if path.startswith(self._ignored_prefixes) or path.endswith(self.asset_suffixes):
             return None
 
-        # Paths to ignore to avoid loops
-        ignored = {
-            reverse("trial_expired"),
-            reverse("marketing_home"),
-            reverse("start_trial"),
-            reverse("admin:login"),
-            reverse("admin:logout"),
-        }
-        if any(request.path.startswith(path) for path in ignored):
+        user = getattr(request, "user", None)
+        if not user or not user.is_authenticated or user.is_superuser:
             return None
 
-        caterer = CatererAccount.objects.filter(owner=user).first()
-        if not caterer or not caterer.trial_expires_at:
+        # Only the expiry timestamp is needed; None covers both "no caterer" and "no expiry".
+        trial_expires_at = (
+            CatererAccount.objects.filter(owner=user)
+            .values_list("trial_expires_at", flat=True)
+            .first()
+        )
+        if not trial_expires_at:
             return None
 
-        if timezone.now() > caterer.trial_expires_at:
+        if timezone.now() > trial_expires_at:
             return redirect("trial_expired")
 
         return None
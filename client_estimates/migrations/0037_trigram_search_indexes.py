@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Admin search uses icontains, which PostgreSQL runs as UPPER(col::text) LIKE UPPER(%s).
+# Trigram GIN indexes on that exact expression let those '%term%' searches use an index.
+TRIGRAM_INDEXES = (
+    ("client_estimates_menuitem", "name", "menuitem_name_trgm"),
+    ("client_estimates_extraitem", "name", "extraitem_name_trgm"),
+    ("client_estimates_clientprofile", "name", "clientprofile_name_trgm"),
+    ("client_estimates_clientinquiry", "contact_name", "clientinquiry_contact_trgm"),
+    ("client_estimates_clientinquiry", "company_name", "clientinquiry_company_trgm"),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, column, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" '
+            f'USING gin ((UPPER("{column}"::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for _table, _column, index_name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{index_name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_estimates", "0036_planneroptioncard"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicate_categories(apps, schema_editor):
+    MenuCategory = apps.get_model("client_estimates", "MenuCategory")
+    MenuItem = apps.get_model("client_estimates", "MenuItem")
+    duplicates = (
+        MenuCategory.objects.values("caterer_id", "name")
+        .annotate(keep_id=Min("id"), total=Count("id"))
+        .filter(total__gt=1)
+    )
+    for group in duplicates:
+        extra_ids = list(
+            MenuCategory.objects.filter(caterer_id=group["caterer_id"], name=group["name"])
+            .exclude(id=group["keep_id"])
+            .values_list("id", flat=True)
+        )
+        MenuItem.objects.filter(category_id__in=extra_ids).update(category_id=group["keep_id"])
+        MenuCategory.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_estimates", "0037_trigram_search_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_categories, migrations.RunPython.noop),
+    ]
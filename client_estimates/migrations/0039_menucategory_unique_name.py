@@ -0,0 +1,18 @@
+from django.db import migrations
+
+# Kept apart from the 0038 data merge: on PostgreSQL the ALTER would otherwise fail
+# on the pending FK trigger events left by that migration's deletes.
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("client_estimates", "0038_merge_duplicate_menucategories"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="menucategory",
+            unique_together={("caterer", "name")},
+        ),
+    ]
@@ -3,7 +3,7 @@ import math
 import secrets
 from datetime import timedelta
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from django.conf import settings
 from django.urls import reverse
@@ -24,6 +24,26 @@ DEFAULT_PAYMENT_TERMS = (
     "the event date unless alternate arrangements are approved in writing."
 )
 
+# Menu order for estimate food choices: category, then per-item override, then name.
+FOOD_CHOICE_MENU_ORDER = (
+    models.F("menu_item__category__sort_order").asc(nulls_last=True),
+    models.F("menu_item__category__name").asc(nulls_last=True),
+    models.F("menu_item__sort_order_override").asc(nulls_last=True),
+    "menu_item__name",
+)
+
+# Columns Estimate.recalc_totals() derives; re-save just these after editing line items.
+DERIVED_TOTALS_FIELDS = (
+    "food_price_per_person",
+    "extras_total",
+    "staff_total",
+    "dishes_total",
+    "grand_total",
+    "deposit_amount",
+    "balance_due",
+    "updated_at",
+)
+
 PAYMENT_METHOD_CHOICES = [
     ("BANK_TRANSFER", "Bank transfer"),
     ("CASH", "Cash"),
@@ -233,6 +253,22 @@ class CatererAccount(models.Model):
             return '"Georgia", "Times New Roman", serif'
         return '"Helvetica Neue", Arial, "Segoe UI", sans-serif'
 
+    def reserve_estimate_number(self):
+        """
+        Hand out the next estimate number, locking the counter row so
+        concurrent saves never issue the same number twice.
+        """
+        with transaction.atomic():
+            counter = (
+                CatererAccount.objects.select_for_update()
+                .filter(pk=self.pk)
+                .values_list("estimate_number_counter", flat=True)
+                .get()
+            ) or 1000
+            CatererAccount.objects.filter(pk=self.pk).update(estimate_number_counter=counter + 1)
+        self.estimate_number_counter = counter + 1
+        return counter
+
     def save(self, *args, **kwargs):
         if not self.slug:
             base_slug = slugify(self.name) or "caterer"
@@ -260,6 +296,7 @@ class MenuCategory(models.Model):
     class Meta:
         ordering = ["sort_order", "name"]
         verbose_name_plural = "Menu categories"
+        unique_together = ("caterer", "name")
 
     def __str__(self):
         return f"{self.caterer.name} – {self.name}"
@@ -823,9 +860,19 @@ class Estimate(models.Model):
             total += section["price_per_guest"]
         return total.quantize(Decimal("0.01"))
 
+    def _prefetched_lines(self, related_name):
+        """
+        Rows loaded by a prefetch_related() on this estimate, or None. Callers that
+        prefetch food_choices must apply FOOD_CHOICE_MENU_ORDER and select menu_item__category.
+        """
+        return getattr(self, "_prefetched_objects_cache", {}).get(related_name)
+
     def calc_extras_total(self) -> Decimal:
         total = Decimal("0.00")
-        for line in self.extra_lines.select_related("extra_item"):
+        lines = self._prefetched_lines("extra_lines")
+        if lines is None:
+            lines = self.extra_lines.select_related("extra_item")
+        for line in lines:
             if line.override_price is not None:
                 total += line.override_price
             else:
@@ -927,10 +974,11 @@ class Estimate(models.Model):
         self.deposit_amount = deposit
         self.balance_due = balance.quantize(Decimal("0.01"))
 
-    def save(self, *args, **kwargs):
+    def save(self, *args, recalc=True, **kwargs):
         if not self.payment_terms and self.caterer_id:
             self.payment_terms = self.caterer.default_payment_terms
-        self.recalc_totals()
+        if recalc:
+            self.recalc_totals()
         super().save(*args, **kwargs)
 
     def meal_sections(self):
@@ -952,16 +1000,15 @@ class Estimate(models.Model):
                 }
                 for name in plan
             ]
-        choices = list(
-            self.food_choices.filter(included=True)
-            .select_related("menu_item", "menu_item__category")
-            .order_by(
-                models.F("menu_item__category__sort_order").asc(nulls_last=True),
-                models.F("menu_item__category__name").asc(nulls_last=True),
-                models.F("menu_item__sort_order_override").asc(nulls_last=True),
-                "menu_item__name",
+        prefetched = self._prefetched_lines("food_choices")
+        if prefetched is not None:
+            choices = [ch for ch in prefetched if ch.included]
+        else:
+            choices = list(
+                self.food_choices.filter(included=True)
+                .select_related("menu_item", "menu_item__category")
+                .order_by(*FOOD_CHOICE_MENU_ORDER)
             )
-        )
         sections = []
         overrides = self.manual_meal_totals or {}
         guest_counts = self.meal_guest_counts()
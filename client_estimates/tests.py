@@ -2,20 +2,27 @@ from decimal import Decimal
 import json
 from datetime import timedelta
 
+from django.contrib import admin as django_admin
+from django.contrib.messages import get_messages
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
-from django.test import TestCase
+from django.forms.models import model_to_dict
+from django.test import RequestFactory, TestCase
 from django.urls import reverse
 from django.utils import timezone
 
+from .admin import EstimateAdmin
 from .models import (
     CatererAccount,
     CatererUserAccess,
     Estimate,
     EstimateFoodChoice,
     EstimateExpenseEntry,
+    EstimateExtraItem,
+    ExtraItem,
     MenuCategory,
     MenuItem,
+    MenuTemplate,
     ShoppingList,
     ShoppingListItem,
     EstimateStaffTimeEntry,
@@ -148,6 +155,19 @@ class XpenzApiTests(TestCase):
         self.assertGreaterEqual(len(ids), 2)
         self.assertEqual(ids[0], self.newer_estimate.id)
 
+    def test_reserve_estimate_number_advances_stored_counter(self):
+        stale = CatererAccount.objects.get(pk=self.caterer.pk)
+        first = self.caterer.reserve_estimate_number()
+        second = stale.reserve_estimate_number()
+        self.assertEqual(second, first + 1)
+        self.caterer.refresh_from_db()
+        self.assertEqual(self.caterer.estimate_number_counter, first + 2)
+
+    def test_trial_middleware_skips_asset_requests(self):
+        self.client.force_login(self.user)
+        with self.assertNumQueries(0):
+            self.client.get("/static/admin/css/base.css")
+
     def test_app_user_sees_jobs_but_not_billing_totals(self):
         token = self._login_and_get_token("appstaff@example.com")
         response = self.client.get(
@@ -289,6 +309,30 @@ class XpenzApiTests(TestCase):
         self.assertContains(response, "Burger Slider")
         self.assertContains(response, "(No sesame)")
 
+    def test_admin_bulk_workflow_and_flat_print_list_extra_lines(self):
+        self.user.is_superuser = True
+        self.user.save(update_fields=["is_superuser"])
+        self.client.force_login(self.user)
+        projector = ExtraItem.objects.create(
+            caterer=self.caterer,
+            name="Projector",
+            price=Decimal("400.00"),
+        )
+        EstimateExtraItem.objects.create(estimate=self.estimate, extra_item=projector, quantity=Decimal("1.00"))
+
+        response = self.client.get(
+            reverse("admin:client_estimates_estimate_workflow_bulk"),
+            {"ids": str(self.estimate.id)},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Projector")
+
+        response = self.client.get(
+            reverse("admin:client_estimates_estimate_print_flat", args=[self.estimate.id]),
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Projector")
+
     def test_estimate_builder_saves_per_meal_overrides(self):
         token = self._login_and_get_token()
         self.estimate.meal_plan = ["Friday Night", "Shabbos Day"]
@@ -498,6 +542,14 @@ class XpenzApiTests(TestCase):
         self.assertEqual(payload["entry"]["expense_text"], "Parking")
         self.assertEqual(payload["entry"]["expense_amount"], "28.50")
 
+    def test_meal_plan_reassignment_is_read_back(self):
+        estimate = self.estimate
+        estimate.meal_plan = ["Friday Night"]
+        self.assertEqual(estimate.default_meal_name(), "Friday Night")
+        estimate.meal_plan = [" Shabbos Day ", ""]
+        self.assertEqual(estimate.get_meal_plan(), ["Shabbos Day"])
+        self.assertEqual(estimate.default_meal_name(), "Shabbos Day")
+
     def test_per_meal_wait_staff_count_overrides_staff_total(self):
         estimate = self.estimate
         estimate.staff_hourly_rate = Decimal("50.00")
@@ -1301,3 +1353,239 @@ class XpenzApiTests(TestCase):
         )
         self.assertEqual(response.status_code, 403)
         self.assertTrue(EstimateExpenseEntry.objects.filter(pk=entry.pk).exists())
+
+    def test_admin_menu_csv_upload_creates_items_and_categories(self):
+        MenuCategory.objects.create(caterer=self.caterer, name="Starters", sort_order=1)
+        csv_content = (
+            "item_type,category,name,description,sort_order_override,cost_per_serving,markup,default_servings_per_person,is_active\n"
+            "Food,Starters,Salmon Bites,Mini bagels,1,12.50,3.0,1.0,True\n"
+            "Food,mains,Steak Strip,Grilled,,28.00,,1.0,True\n"
+            "Extra,Rental,Projector,,,400,2.0,1.0,False\n"
+        ).encode("utf-8")
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("admin:menu-upload-csv"),
+            data={"csv_file": SimpleUploadedFile("menu.csv", csv_content, content_type="text/csv")},
+        )
+        self.assertEqual(response.status_code, 302)
+
+        self.assertEqual(
+            MenuCategory.objects.filter(caterer=self.caterer, name="Starters").count(),
+            1,
+        )
+        self.assertTrue(MenuCategory.objects.filter(caterer=self.caterer, name="Mains").exists())
+        salmon = MenuItem.objects.get(caterer=self.caterer, name="Salmon Bites")
+        self.assertEqual(salmon.category.name, "Starters")
+        self.assertEqual(salmon.sort_order_override, 1)
+        self.assertEqual(salmon.cost_per_serving, Decimal("12.50"))
+        steak = MenuItem.objects.get(caterer=self.caterer, name="Steak Strip")
+        self.assertEqual(steak.markup, self.caterer.default_food_markup)
+        projector = ExtraItem.objects.get(caterer=self.caterer, name="Projector")
+        self.assertEqual(projector.price, Decimal("800.00"))
+        self.assertFalse(projector.is_active)
+
+    def test_admin_menu_csv_upload_rejects_missing_columns(self):
+        csv_content = b"item_type,name,cost_per_serving\nFood,Salmon Bites,12.50\n"
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("admin:menu-upload-csv"),
+            data={"csv_file": SimpleUploadedFile("menu.csv", csv_content, content_type="text/csv")},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ["CSV is missing required columns: category"],
+        )
+        self.assertFalse(MenuItem.objects.filter(caterer=self.caterer).exists())
+        self.assertFalse(MenuCategory.objects.filter(caterer=self.caterer).exists())
+
+    def test_admin_menu_csv_upload_reports_short_rows(self):
+        csv_content = b"item_type,category,name,cost_per_serving\nFood,Mains,Brisket,10\nFood,Mains\n"
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("admin:menu-upload-csv"),
+            data={"csv_file": SimpleUploadedFile("menu.csv", csv_content, content_type="text/csv")},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            [str(message) for message in get_messages(response.wsgi_request)],
+            ["Some CSV rows are missing item_type, category or name (data rows: 2). Nothing was imported."],
+        )
+        self.assertFalse(MenuItem.objects.filter(caterer=self.caterer).exists())
+
+    def test_admin_menu_csv_template_round_trips_through_upload(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:menu-download-template"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertTrue(response.content.startswith(b"item_type,category,name,"))
+
+        response = self.client.post(
+            reverse("admin:menu-upload-csv"),
+            data={"csv_file": SimpleUploadedFile("menu.csv", response.content, content_type="text/csv")},
+        )
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(MenuItem.objects.filter(caterer=self.caterer).count(), 2)
+        self.assertTrue(ExtraItem.objects.filter(caterer=self.caterer, name="Projector").exists())
+
+    def test_admin_menu_item_changelist_defers_unrendered_columns(self):
+        self.user.is_superuser = True
+        self.user.save(update_fields=["is_superuser"])
+        MenuItem.objects.create(
+            caterer=self.caterer,
+            name="Salmon Bites",
+            description="Mini bagels with lox",
+            cost_per_serving=Decimal("12.50"),
+        )
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:client_estimates_menuitem_changelist"))
+        self.assertEqual(response.status_code, 200)
+        item = response.context["cl"].result_list[0]
+        self.assertIn("description", item.get_deferred_fields())
+        self.assertContains(response, "Salmon Bites")
+
+    def test_admin_estimate_changelist_defers_text_columns(self):
+        self.user.is_superuser = True
+        self.user.save(update_fields=["is_superuser"])
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("admin:client_estimates_estimate_changelist"))
+        self.assertEqual(response.status_code, 200)
+        estimate = response.context["cl"].result_list[0]
+        self.assertIn("contract_terms", estimate.get_deferred_fields())
+
+        response = self.client.get(
+            reverse("admin:client_estimates_estimate_change", args=[estimate.pk])
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["original"].get_deferred_fields(), set())
+
+    def test_estimate_admin_save_replaces_food_and_extra_lines(self):
+        category = MenuCategory.objects.create(caterer=self.caterer, name="Mains", sort_order=1)
+        brisket = MenuItem.objects.create(
+            caterer=self.caterer,
+            category=category,
+            name="Brisket",
+            cost_per_serving=Decimal("10.00"),
+        )
+        salmon = MenuItem.objects.create(
+            caterer=self.caterer,
+            category=category,
+            name="Salmon",
+            cost_per_serving=Decimal("12.00"),
+        )
+        linens = ExtraItem.objects.create(
+            caterer=self.caterer,
+            name="Linens",
+            category="DECOR",
+            cost=Decimal("5.00"),
+            price=Decimal("15.00"),
+        )
+        EstimateFoodChoice.objects.create(estimate=self.estimate, menu_item=salmon, meal_name="Dinner")
+        kept_choice = EstimateFoodChoice.objects.create(
+            estimate=self.estimate,
+            menu_item=brisket,
+            meal_name="Lunch",
+            servings_per_person=Decimal("1.00"),
+        )
+
+        request = RequestFactory().post("/")
+        request.user = self.user
+        estimate_admin = EstimateAdmin(Estimate, django_admin.site)
+        form_class = estimate_admin.get_form(request, self.estimate)
+        data = {
+            key: value
+            for key, value in model_to_dict(self.estimate).items()
+            if value is not None and not isinstance(value, (dict, list)) and key in form_class.base_fields
+        }
+        data.update(
+            {
+                "meal_plan_input": "Dinner\nLunch",
+                "include_item_%s_meal_1" % brisket.id: "on",
+                "servings_item_%s_meal_1" % brisket.id: "1.50",
+                "include_extra_%s" % linens.id: "on",
+                "quantity_extra_%s" % linens.id: "3",
+            }
+        )
+        form = form_class(data=data, instance=self.estimate)
+        self.assertTrue(form.is_valid(), form.errors)
+        estimate_admin.save_model(request, form.save(commit=False), form, change=True)
+
+        choices = list(self.estimate.food_choices.values_list("menu_item_id", "meal_name", "servings_per_person"))
+        self.assertEqual(choices, [(brisket.id, "Lunch", Decimal("1.50"))])
+        self.assertEqual(self.estimate.food_choices.get().pk, kept_choice.pk)
+        line = self.estimate.extra_lines.get()
+        self.assertEqual(line.extra_item_id, linens.id)
+        self.assertEqual(line.quantity, Decimal("3.00"))
+        self.estimate.refresh_from_db()
+        self.assertGreater(self.estimate.extras_total, Decimal("0.00"))
+        self.assertEqual(self.estimate.extras_total, self.estimate.calc_extras_total())
+
+    def test_estimate_change_view_adds_inline_menu_items(self):
+        category = MenuCategory.objects.create(caterer=self.caterer, name="Sides", sort_order=1)
+        self.client.force_login(self.user)
+        response = self.client.post(
+            reverse("admin:client_estimates_estimate_change", args=[self.estimate.pk]),
+            data={
+                "caterer": self.caterer.pk,
+                f"new_item_name_{category.pk}": "Kugel",
+                f"new_item_cost_{category.pk}": "2.50",
+                "new_item_name_none": "Challah",
+                "_save_new_menu_item": "1",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        items = {item.name: item for item in MenuItem.objects.filter(caterer=self.caterer)}
+        self.assertEqual(set(items), {"Kugel", "Challah"})
+        self.assertEqual(items["Kugel"].category_id, category.pk)
+        self.assertEqual(items["Kugel"].cost_per_serving, Decimal("2.50"))
+        self.assertIsNone(items["Challah"].category_id)
+
+    def test_estimate_form_only_validates_values_of_ticked_rows(self):
+        brisket = MenuItem.objects.create(caterer=self.caterer, name="Brisket", cost_per_serving=Decimal("10.00"))
+        salmon = MenuItem.objects.create(caterer=self.caterer, name="Salmon", cost_per_serving=Decimal("12.00"))
+        request = RequestFactory().post("/")
+        request.user = self.user
+        form_class = EstimateAdmin(Estimate, django_admin.site).get_form(request, self.estimate)
+        data = {
+            key: value
+            for key, value in model_to_dict(self.estimate).items()
+            if value is not None and not isinstance(value, (dict, list)) and key in form_class.base_fields
+        }
+        data.update(
+            {
+                "include_item_%s_meal_0" % brisket.id: "on",
+                "servings_item_%s_meal_0" % brisket.id: "lots",
+                "servings_item_%s_meal_0" % salmon.id: "lots",
+            }
+        )
+        form = form_class(data=data, instance=self.estimate)
+        self.assertFalse(form.is_valid())
+        self.assertIn("servings_item_%s_meal_0" % brisket.id, form.errors)
+        self.assertNotIn("servings_item_%s_meal_0" % salmon.id, form.errors)
+
+    def test_inline_menu_item_markup_falls_back_to_fixed_default(self):
+        CatererAccount.objects.filter(pk=self.caterer.pk).update(default_food_markup=Decimal("2.50"))
+        self.client.force_login(self.user)
+        self.client.post(
+            reverse("admin:client_estimates_estimate_change", args=[self.estimate.pk]),
+            data={
+                "caterer": self.caterer.pk,
+                "new_item_name_none": "Challah",
+                "new_item_markup_none": "abc",
+                "_save_new_menu_item": "1",
+            },
+        )
+        self.assertEqual(MenuItem.objects.get(caterer=self.caterer, name="Challah").markup, Decimal("3.00"))
+
+    def test_estimate_form_template_choices_refresh_after_template_save(self):
+        MenuTemplate.objects.create(caterer=self.caterer, name="Buffet")
+        request = RequestFactory().get("/")
+        request.user = self.user
+        form_class = EstimateAdmin(Estimate, django_admin.site).get_form(request, self.estimate)
+
+        labels = [label for _value, label in form_class(instance=self.estimate).fields["use_template"].choices]
+        self.assertIn("Buffet (Owner Catering)", labels)
+
+        MenuTemplate.objects.create(caterer=self.caterer, name="Plated")
+        labels = [label for _value, label in form_class(instance=self.estimate).fields["use_template"].choices]
+        self.assertIn("Plated (Owner Catering)", labels)
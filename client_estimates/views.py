@@ -1595,10 +1595,9 @@ def xpenz_estimate_list(request):
         if currency not in valid_currencies:
             currency = caterer.default_currency
 
-        counter = caterer.estimate_number_counter or 1000
         estimate = Estimate.objects.create(
             caterer=caterer,
-            estimate_number=counter,
+            estimate_number=caterer.reserve_estimate_number(),
             customer_name=customer_name,
             customer_phone=customer_phone,
             customer_email=customer_email,
@@ -1615,8 +1614,6 @@ def xpenz_estimate_list(request):
                 or "0"
             ),
         )
-        caterer.estimate_number_counter = counter + 1
-        caterer.save(update_fields=["estimate_number_counter"])
         estimate.refresh_from_db()
         estimate.expense_count = 0
         return JsonResponse(